@@ -49,12 +49,11 @@ def import_faces(rhino3dm_file, tolerance=None):
         'door': (None, Door)
     }
 
-    for layer in rhino3dm_file.Layers:
-        if layer.Name not in layer_to_hb_object:
-            warnings.warn(
-                f'Only objects on layers {tuple(layer_to_hb_object.keys())} will be'
-                'imported during the process of importing faces.'
-            )
+    if any(layer.Name not in layer_to_hb_object for layer in rhino3dm_file.Layers):
+        warnings.warn(
+            f'Only objects on layers {tuple(layer_to_hb_object.keys())} will be'
+            ' imported during the process of importing faces.'
+        )
 
     # get all the objects for valid layers
     layers = list(layer_to_hb_object.keys())
@@ -70,12 +69,15 @@ def import_faces(rhino3dm_file, tolerance=None):
 
             lb_faces = to_face3d(obj, tolerance=tolerance)
             name = obj.Attributes.Name
+            # clean the user assigned name once for all the sub faces
+            name = clean_string(name) if name else None
             for face_obj in lb_faces:
                 # TODO: Double check with Chris if this naming works for energy models.
                 # if name is assigned by user use the same name for all the sub faces
                 # otherwise generate a randome name based on the layer name.
+                # clean_and_id_string already returns a clean string.
                 obj_name = name or clean_and_id_string(layer)
-                args = [clean_string(obj_name), face_obj]
+                args = [obj_name, face_obj]
                 if hb_face_type:
                     args.append(hb_face_type)
                     hb_face = hb_face_module(*args)
@@ -69,12 +69,14 @@ def filter_objects_by_layers(file_3dm, layer_names):
     Returns:
         A list of lists. A sub-list for each of the layers in layer_names
     """
-    # get layer tables
-    layer_table = {layer.Index: layer.Name for layer in file_3dm.Layers}
-
     # create a place holder for each layer
     objects = {layer_name: [] for layer_name in layer_names}
 
+    # get layer tables only for the input layer names
+    layer_table = {
+        layer.Index: layer.Name for layer in file_3dm.Layers if layer.Name in objects
+    }
+
     # get index for each layer
     for obj in file_3dm.Objects:
         index = obj.Attributes.LayerIndex
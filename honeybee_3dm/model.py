@@ -49,14 +49,9 @@ def import_3dm(path, name=None):
 
     # Honeybee Rooms
     hb_rooms = import_rooms(rhino3dm_file, model_tolerance)
-    # Honeybee Faces
-    hb_faces = import_faces(rhino3dm_file, model_tolerance)[0]
-    # Honeybee Shades
-    hb_shades = import_faces(rhino3dm_file, model_tolerance)[1]
-    # Honeybee Apertures
-    hb_apertures = import_faces(rhino3dm_file, model_tolerance)[2]
-    # Honeybee Doors
-    hb_doors = import_faces(rhino3dm_file, model_tolerance)[3]
+    # Honeybee Faces, Shades, Apertures and Doors
+    hb_faces, hb_shades, hb_apertures, hb_doors = import_faces(
+        rhino3dm_file, model_tolerance)
     # Honeybee Grids
     hb_grids = import_grids(rhino3dm_file, model_tolerance)
     # Honeybee Model
@@ -7,6 +7,9 @@
 # The Rhino3dm library provides the ability to access content of a Rhino3dm
 # file from outside of Rhino
 import warnings
+from math import floor
+from itertools import chain, product
+from operator import itemgetter
 import rhino3dm
 
 # Importing Ladybug geometry dependencies
@@ -18,6 +21,12 @@ from ladybug_geometry.geometry3d.polyline import Polyline3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 from ladybug_geometry.geometry3d.polyface import Polyface3D
 
+# rhino3dm enum values that are used in loops are looked up once on import
+_MESH_ANY = rhino3dm.MeshType.Any
+_BREP = rhino3dm.ObjectType.Brep
+_EXTRUSION = rhino3dm.ObjectType.Extrusion
+_MESH = rhino3dm.ObjectType.Mesh
+
 
 def to_point3d(point):
     """Create a Ladybug Point3D object from a rhino3dm point.
@@ -43,18 +52,139 @@ def to_vector3d(vector):
     return Vector3D(vector.X, vector.Y, vector.Z)
 
 
+def _mesh_points(mesh):
+    """Get a tuple of Ladybug Point3D objects for all the vertices of a rhino3dm Mesh.
+
+    The vertex list is fetched from the mesh only once since every access to
+    mesh.Vertices creates a new rhino3dm wrapper object. A tuple is returned
+    since that is what Mesh3D stores and it can be shared without a copy.
+
+    Args:
+        mesh: A rhino3dm mesh geometry.
+
+    Returns:
+        A tuple of Ladybug Point3D objects.
+    """
+    vertices = mesh.Vertices
+    return tuple(Point3D(pt.X, pt.Y, pt.Z)
+                 for pt in (vertices[i] for i in range(len(vertices))))
+
+
+def _mesh_face_indices(mesh):
+    """Get a list of vertex index tuples for all the faces of a rhino3dm Mesh.
+
+    rhino3dm always returns four indices per face and repeats the third index for
+    triangles. Triangles are returned as tuples of three indices and quads as
+    tuples of four indices.
+
+    Args:
+        mesh: A rhino3dm mesh geometry.
+
+    Returns:
+        A list of tuples of vertex indices.
+    """
+    faces = mesh.Faces
+    all_faces = [faces[i] for i in range(len(faces))]
+    # skip the check on each face when the mesh has only one type of face
+    if faces.QuadCount == 0:
+        return [face[:3] for face in all_faces]
+    if faces.TriangleCount == 0:
+        return all_faces
+    return [face if face[2] != face[3] else face[:3] for face in all_faces]
+
+
+def _meshes_from_geo(geo):
+    """Yield rhino3dm Meshes for a rhino3dm Brep or Extrusion.
+
+    A Brep is meshed face by face while an Extrusion is meshed as a whole.
+
+    Args:
+        geo: A rhino3dm Brep or Extrusion.
+
+    Yields:
+        A rhino3dm Mesh.
+    """
+    # Meshing is kept serial. rhino3dm does not release the GIL in its bindings and
+    # GetMesh only copies the render mesh that is stored in the 3dm file, so
+    # running it on multiple threads adds overhead without any speedup.
+    if isinstance(geo, rhino3dm.Brep):
+        brep_faces = geo.Faces
+        for i in range(len(brep_faces)):
+            yield brep_faces[i].GetMesh(_MESH_ANY)
+    else:
+        yield geo.GetMesh(_MESH_ANY)
+
+
+def _point_key(point, tolerance):
+    """Get a hashable key for a Ladybug Point3D snapped to a grid of the tolerance size.
+
+    Points that share a key are equivalent within the tolerance. This is used to
+    look up points in a set instead of searching through a list.
+
+    Args:
+        point: A Ladybug Point3D object.
+        tolerance: A number for the size of the grid.
+
+    Returns:
+        A tuple of three integers.
+    """
+    return (floor(point.x / tolerance), floor(point.y / tolerance),
+            floor(point.z / tolerance))
+
+
+def _points_grid(points, tolerance):
+    """Group Ladybug Point3D objects by their key on a grid of the tolerance size.
+
+    Args:
+        points: A list of Ladybug Point3D objects.
+        tolerance: A number for the size of the grid.
+
+    Returns:
+        A dictionary with grid keys as keys and lists of Point3D objects as values.
+    """
+    grid = {}
+    for pt in points:
+        grid.setdefault(_point_key(pt, tolerance), []).append(pt)
+    return grid
+
+
+def _is_point_in_grid(point, grid, tolerance):
+    """Check if a Point3D is equivalent to any of the points in a grid.
+
+    Points that are equivalent within the tolerance are never more than one grid
+    cell apart so the cell of the point and all the cells around it are checked.
+
+    Args:
+        point: A Ladybug Point3D object.
+        grid: A dictionary of points created using the _points_grid function.
+        tolerance: A number for the tolerance that was used to create the grid.
+
+    Returns:
+        Bool. True if an equivalent point is found in the grid otherwise False.
+    """
+    x, y, z = _point_key(point, tolerance)
+    keys = product((x - 1, x, x + 1), (y - 1, y, y + 1), (z - 1, z, z + 1))
+    return any(point.is_equivalent(other, tolerance)
+               for key in keys for other in grid.get(key, ()))
+
+
 def remove_dup_vertices(vertices, tolerance):
     """Remove vertices from an array of Point3Ds that are equal within the tolerance.
 
     Args:
         vertices: A list of Ladybug Point3D objects.
+        tolerance: A number for the maximum difference between coordinate values
+            at which two points are considered equal.
 
     Returns:
          A list of Ladybug Point3D objects with duplicate points removed.
 
     """
-    return [pt for i, pt in enumerate(vertices)
-            if not pt.is_equivalent(vertices[i - 1], tolerance)]
+    # This is the same test as Point3D.is_equivalent written inline to skip a
+    # method call for every vertex
+    return [pt for pt, prev in zip(vertices, vertices[-1:] + vertices[:-1])
+            if abs(pt.x - prev.x) > tolerance or abs(pt.y - prev.y) > tolerance
+            or abs(pt.z - prev.z) > tolerance]
 
 
 def check_planarity(brep):
@@ -66,9 +196,9 @@ def check_planarity(brep):
     Returns:
         Bool. True if planar otherwise False
     """
-    is_planar = [brep.Faces[i].UnderlyingSurface().IsPlanar()
-        for i in range(len(brep.Faces))]
-    return all(is_planar)
+    brep_faces = brep.Faces
+    return all(brep_faces[i].UnderlyingSurface().IsPlanar()
+               for i in range(len(brep_faces)))
 
 
 def extract_mesh_faces_colors(mesh, color_by_face=False):
@@ -83,24 +213,16 @@ def extract_mesh_faces_colors(mesh, color_by_face=False):
     """
 
     colors = None
-    lb_faces = []
-    for i in range(len(mesh.Faces)):
-        face = mesh.Faces[i]
-        if len(face) == 4:
-            lb_faces.append((face[0], face[1], face[2], face[3]))
-        else:
-            lb_faces.append((face[0], face[1], face[2]))
-    if len(mesh.VertexColors) != 0:
-        colors = []
+    lb_faces = _mesh_face_indices(mesh)
+    vertex_colors = mesh.VertexColors
+    if len(vertex_colors) != 0:
+        # read each vertex color from rhino3dm only once
+        # rhino3dm returns colors as (red, green, blue, alpha) tuples
+        rgbs = [vertex_colors[k][:3] for k in range(len(vertex_colors))]
         if color_by_face is True:
-            for j in range(len(mesh.Faces)):
-                face = mesh.Faces[j]
-                col = mesh.VertexColors[face[0]]
-                colors.append(lbc.Color(col.R, col.G, col.B))
+            colors = [lbc.Color(*rgbs[face[0]]) for face in lb_faces]
         else:
-            for k in range(len(mesh.VertexColors)):
-                col = mesh.VertexColors[k]
-                colors.append(lbc.Color(col.R, col.G, col.B))
+            colors = [lbc.Color(*rgb) for rgb in rgbs]
     return lb_faces, colors
 
 
@@ -114,7 +236,7 @@ def mesh_to_mesh3d(mesh, color_by_face=True):
     Returns:
         A Ladybug Mesh3D object
     """
-    lb_verts = tuple(to_point3d(mesh.Vertices[i]) for i in range(len(mesh.Vertices)))
+    lb_verts = _mesh_points(mesh)
     lb_faces, colors = extract_mesh_faces_colors(mesh, color_by_face)
     return Mesh3D(lb_verts, lb_faces, colors)
 
@@ -129,20 +251,9 @@ def mesh_to_face3d(mesh):
         A list of Ladybug Face3D objects.
     """
 
-    faces = []
-    pts = [to_point3d(mesh.Vertices[i]) for i in range(len(mesh.Vertices))]
-
-    for j in range(len(mesh.Faces)):
-        face = mesh.Faces[j]
-        if len(face) == 4:
-            all_verts = (pts[face[0]], pts[face[1]],
-                         pts[face[2]], pts[face[3]])
-        else:
-            all_verts = (pts[face[0]], pts[face[1]], pts[face[2]])
-
-        faces.append(Face3D(all_verts))
-
-    return faces
+    pts = _mesh_points(mesh)
+    # itemgetter gathers all the vertices of a face in one call
+    return [Face3D(itemgetter(*face)(pts)) for face in _mesh_face_indices(mesh)]
 
 
 def brep_to_meshed_face3d(brep):
@@ -158,10 +269,7 @@ def brep_to_meshed_face3d(brep):
         A Ladybug Face3D object.
     """
 
-    faces = []
-    for i in range(len(brep.Faces)):
-        mesh = brep.Faces[i].GetMesh(rhino3dm.MeshType.Any)
-        faces.extend(mesh_to_face3d(mesh))
+    faces = brep_to_mesh_to_face3d(brep)
     polyface = Polyface3D.from_faces(faces, 0.01)
     lines = list(polyface.naked_edges)
     polylines = Polyline3D.join_segments(lines, 0.01)
@@ -180,11 +288,8 @@ def brep_to_mesh_to_face3d(brep):
         A list of Ladybug Face3D objects.
     """
 
-    faces = []
-    for i in range(len(brep.Faces)):
-        mesh = brep.Faces[i].GetMesh(rhino3dm.MeshType.Any)
-        faces.extend(mesh_to_face3d(mesh))
-    return faces
+    return list(chain.from_iterable(
+        mesh_to_face3d(mesh) for mesh in _meshes_from_geo(brep)))
 
 
 def brep_to_face3d(brep, tolerance):
@@ -199,29 +304,26 @@ def brep_to_face3d(brep, tolerance):
     Returns:
         A Ladybug Face3D object.
     """
-    # face3ds = []
-    # Getting all vertices of the face
-    mesh = brep.Faces[0].GetMesh(rhino3dm.MeshType.Any)
-
     # * Check 01 - If any of the edge is an arc
-    lines = []
-    curved = False
-    for i in range(len(brep.Edges)):
-        if not brep.Edges[i].IsLinear(tolerance):
-            curved = True
-            break
+    edges = brep.Edges
+    curved = any(not edges[i].IsLinear(tolerance) for i in range(len(edges)))
     # If one of the edges is curved, mesh it
     if curved:
         return brep_to_meshed_face3d(brep)
-    elif len(mesh.Vertices) == 4 or len(mesh.Vertices) == 3:
+
+    # Getting all vertices of the face
+    # The face is only meshed here so that a curved Brep is not meshed twice
+    mesh = brep.Faces[0].GetMesh(_MESH_ANY)
+    if len(mesh.Vertices) in (3, 4):
         return mesh_to_face3d(mesh)[0]
     else:
         # Create Ladybug lines from start and end points of edges
-        for i in range(len(brep.Edges)):
-            start_pt = to_point3d(brep.Edges[i].PointAtStart)
-            end_pt = to_point3d(brep.Edges[i].PointAtEnd)
-            line = LineSegment3D.from_end_points(start_pt, end_pt)
-            lines.append(line)
+        # Each edge is fetched from the Brep only once for both of its end points
+        lines = [
+            LineSegment3D.from_end_points(
+                to_point3d(edge.PointAtStart), to_point3d(edge.PointAtEnd))
+            for edge in (edges[i] for i in range(len(edges)))
+        ]
 
         # Create Ladybug Polylines from the lines
         polylines = Polyline3D.join_segments(lines, tolerance)
@@ -238,16 +340,14 @@ def brep_to_face3d(brep, tolerance):
         # In the list of the Polylines, if there's more than one polyline then
         # the face has hole / holes
         elif len(polylines) > 1:
-            # Get the area of Face3D created by the polylines
-            polyline_areas = [Face3D(polyline.vertices).area for polyline in polylines]
             # Sort the Polylines based on area of face created from polyline vertices
             # The longest polyline belongs to the boundary of the face
             # The rest of the polylines belong to the holes in the face
-            sorted_polylines = [polyline for _, polyline in
-                sorted(zip(polyline_areas, polylines))]
             # The first polyline in the list shall always be the polyline for
             # the boundary
-            sorted_polylines.reverse()
+            sorted_polylines = sorted(
+                polylines, key=lambda polyline: Face3D(polyline.vertices).area,
+                reverse=True)
             # Vertices for the boundary
             # When accessing the vertices for a polyline, a duplicate vertice is
             # found in the tuple of vertices. This is fixed by using this
@@ -260,11 +360,11 @@ def brep_to_face3d(brep, tolerance):
             # Merging lists of hole vertices
             total_hole_pts = [
                 pts for pts_lst in hole_pts for pts in pts_lst]
-            hole_pts_on_boundary = [
-                pts for pts in total_hole_pts if pts in boundary_pts]
+            boundary_grid = _points_grid(boundary_pts, tolerance)
 
             # * Check 02 - If any of the hole is touching the boundary of the face
-            if len(hole_pts_on_boundary) > 0:
+            if any(_is_point_in_grid(pt, boundary_grid, tolerance)
+                   for pt in total_hole_pts):
                 warnings.warn(
                     'A Brep has holes that touch the boundary of the brep.'
                     ' These holes are ignored by Honeybee.'
@@ -274,40 +374,21 @@ def brep_to_face3d(brep, tolerance):
                 return Face3D(boundary=boundary_pts, holes=hole_pts)
 
 
-def solid_to_face3d(brep):
-    """Get a list of Ladybug Face3D objects from a solid rhino3dm Brep.
-
-    This function is used in translating rhino3dm solid volumes to Ladybug Face3D
-    objects.
-
-    Args:
-        brep: A rhino3dm Brep.
-
-    Returns:
-        A list of Ladybug Face3D objects.
-    """
-    faces = []
-    for i in range(len(brep.Faces)):
-        mesh = brep.Faces[i].GetMesh(rhino3dm.MeshType.Any)
-        faces.extend(mesh_to_face3d(mesh))
-
-    return faces
+# A solid Brep is meshed face by face exactly like a non-planar Brep
+solid_to_face3d = brep_to_mesh_to_face3d
 
 
 def extrusion_to_face3d(extrusion):
     """Get a list of Ladybug Face3D objects from a rhino3dm Extrusion.
 
     Args:
-        brep: A rhino3dm Extrusion.
+        extrusion: A rhino3dm Extrusion.
 
     Returns:
         A list of Ladybug Face3D objects.
     """
-    faces = []
-    mesh = extrusion.GetMesh(rhino3dm.MeshType.Any)
-    faces.extend(mesh_to_face3d(mesh))
-
-    return faces
+    return list(chain.from_iterable(
+        mesh_to_face3d(mesh) for mesh in _meshes_from_geo(extrusion)))
 
 
 def to_face3d(obj, *, tolerance, raise_exception=True):
@@ -331,8 +412,9 @@ def to_face3d(obj, *, tolerance, raise_exception=True):
 
     """
     rh_geo = obj.Geometry
+    object_type = rh_geo.ObjectType
 
-    if rh_geo.ObjectType == rhino3dm.ObjectType.Brep:
+    if object_type == _BREP:
         if rh_geo.IsSolid:
             lb_face = solid_to_face3d(rh_geo)
         else:
@@ -341,16 +423,16 @@ def to_face3d(obj, *, tolerance, raise_exception=True):
             else:
                 lb_face = brep_to_mesh_to_face3d(rh_geo)
 
-    elif rh_geo.ObjectType == rhino3dm.ObjectType.Extrusion:
+    elif object_type == _EXTRUSION:
         lb_face = extrusion_to_face3d(rh_geo)
 
-    elif rh_geo.ObjectType == rhino3dm.ObjectType.Mesh:
+    elif object_type == _MESH:
         lb_face = mesh_to_face3d(rh_geo)
 
     else:
         if raise_exception:
-            raise ValueError(f'Unsupported object type: {rh_geo.ObjectType}')
-        warnings.warn(f'Unsupported object type: {rh_geo.ObjectType}')
+            raise ValueError(f'Unsupported object type: {object_type}')
+        warnings.warn(f'Unsupported object type: {object_type}')
         lb_face = []
 
     return lb_face
@@ -0,0 +1,115 @@
+import rhino3dm
+from ladybug.color import Color
+from ladybug_geometry.geometry3d import Point3D
+from honeybee_3dm.togeometry import _points_grid, _is_point_in_grid, \
+    extract_mesh_faces_colors, mesh_to_mesh3d, mesh_to_face3d, brep_to_face3d
+
+
+def _colored_mesh():
+    mesh = rhino3dm.Mesh()
+    for pt in [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]:
+        mesh.Vertices.Add(*pt)
+    for col in [(255, 0, 0), (0, 255, 0), (0, 0, 255), (10, 20, 30)]:
+        mesh.VertexColors.Add(*col)
+    mesh.Faces.AddFace(0, 1, 2)
+    mesh.Faces.AddFace(3, 2, 0)
+    return mesh
+
+
+def test_point_in_grid():
+    boundary_pts = [Point3D(0, 0, 0), Point3D(5, 0, 0), Point3D(5, 5, 0),
+                    Point3D(0, 5, 0)]
+    grid = _points_grid(boundary_pts, 0.01)
+    # a hole vertex on a boundary vertex
+    assert _is_point_in_grid(Point3D(5, 0.004, 0), grid, 0.01)
+    # a hole vertex away from the boundary vertices
+    assert not _is_point_in_grid(Point3D(2, 2, 0), grid, 0.01)
+
+
+def test_point_in_grid_exact_tolerance():
+    grid = _points_grid([Point3D(0.005, 0, 0)], 0.01)
+    point = Point3D(0.015, 0, 0)
+    assert point.is_equivalent(Point3D(0.005, 0, 0), 0.01)
+    assert _is_point_in_grid(point, grid, 0.01)
+    assert not _is_point_in_grid(Point3D(0.025, 0, 0), grid, 0.01)
+
+
+def test_mesh_colors_by_face():
+    faces, colors = extract_mesh_faces_colors(_colored_mesh(), color_by_face=True)
+    assert len(faces) == 2
+    assert colors == [Color(255, 0, 0), Color(10, 20, 30)]
+    mesh3d = mesh_to_mesh3d(_colored_mesh(), color_by_face=True)
+    assert mesh3d.colors == (Color(255, 0, 0), Color(10, 20, 30))
+
+
+def test_mesh_colors_by_vertex():
+    faces, colors = extract_mesh_faces_colors(_colored_mesh(), color_by_face=False)
+    assert colors == [Color(255, 0, 0), Color(0, 255, 0), Color(0, 0, 255),
+                      Color(10, 20, 30)]
+    mesh3d = mesh_to_mesh3d(_colored_mesh(), color_by_face=False)
+    assert len(mesh3d.colors) == 4
+    assert mesh3d.colors[3] == Color(10, 20, 30)
+
+
+def test_mesh_mixed_faces():
+    mesh = rhino3dm.Mesh()
+    for pt in [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0), (2, 1, 0)]:
+        mesh.Vertices.Add(*pt)
+    mesh.Faces.AddFace(0, 1, 2)
+    mesh.Faces.AddFace(1, 4, 5, 2)
+    mesh.Faces.AddFace(0, 2, 3)
+    faces = mesh_to_face3d(mesh)
+    assert [len(face.vertices) for face in faces] == [3, 4, 3]
+    assert faces[1].vertices[1] == Point3D(2, 0, 0)
+    lb_faces, _ = extract_mesh_faces_colors(mesh)
+    assert lb_faces == [(0, 1, 2), (1, 4, 5, 2), (0, 2, 3)]
+
+
+def test_brep_with_hole():
+    rhino3dm_file = rhino3dm.File3dm.Read('./tests/assets/test.3dm')
+    brep = rhino3dm_file.Objects[0].Geometry
+    face = brep_to_face3d(brep, 0.01)
+    assert face.has_holes
+    assert len(face.holes) == 1
+    assert len(face.boundary) == 4
+    assert round(face.area, 4) == 18.8957
+
+
+class _Edge(object):
+    """A line edge that looks like a rhino3dm BrepEdge to brep_to_face3d."""
+
+    def __init__(self, start, end):
+        self.PointAtStart = rhino3dm.Point3d(*start)
+        self.PointAtEnd = rhino3dm.Point3d(*end)
+
+    def IsLinear(self, tolerance):
+        return True
+
+
+class _BrepFace(object):
+    """A Brep face that looks like a rhino3dm BrepFace to brep_to_face3d."""
+
+    def GetMesh(self, mesh_type):
+        mesh = rhino3dm.Mesh()
+        for _ in range(12):
+            mesh.Vertices.Add(0, 0, 0)
+        return mesh
+
+
+class _Brep(object):
+    """A planar Brep with holes that looks like a rhino3dm Brep to brep_to_face3d."""
+
+    def __init__(self, loops):
+        self.Faces = [_BrepFace()]
+        self.Edges = [
+            _Edge(loop[i - 1], loop[i]) for loop in loops for i in range(len(loop))]
+
+
+def test_brep_with_equal_area_holes():
+    boundary = [(0, 0, 0), (10, 0, 0), (10, 10, 0), (0, 10, 0)]
+    hole_1 = [(2, 2, 0), (4, 2, 0), (4, 4, 0), (2, 4, 0)]
+    hole_2 = [(6, 6, 0), (8, 6, 0), (8, 8, 0), (6, 8, 0)]
+    face = brep_to_face3d(_Brep([hole_1, boundary, hole_2]), 0.01)
+    assert len(face.boundary) == 4
+    assert len(face.holes) == 2
+    assert face.area == 92